@@ -5,15 +5,207 @@ A clean, professional Python/Streamlit application for browsing and copying Git
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 from pathlib import Path
 import json
+import os
+import math
+
+
+APP_CSS = """
+<style>
+    .main {
+        background-color: #ffffff;
+        color: #333333;
+    }
+    .block-container {
+        padding-top: 1rem;
+        padding-bottom: 0rem;
+    }
+    /* Esconde completamente todos os elementos da barra padrão do Streamlit */
+    header {display: none !important;}
+    footer {display: none !important;}
+    #MainMenu {display: none !important;}
+    /* Remove qualquer espaço em branco adicional */
+    div[data-testid="stAppViewBlockContainer"] {
+        padding-top: 0 !important;
+        padding-bottom: 0 !important;
+    }
+    div[data-testid="stVerticalBlock"] {
+        gap: 0 !important;
+        padding-top: 0 !important;
+        padding-bottom: 0 !important;
+    }
+    /* Remove quaisquer margens extras */
+    .element-container {
+        margin-top: 0 !important;
+        margin-bottom: 0 !important;
+    }
+</style>
+"""
+
+HEADER_HTML = """
+<div style='text-align: center; padding: 1rem 0;'>
+    <h1 style='color: #2E86C1; margin-bottom: 0.5rem;'>
+        🔧GitApp
+    </h1>
+    <p style='color: #566573; font-size: 1.1rem; margin-bottom: 2rem;'>
+        <strong>Web App de Comandos Git</strong>
+    </p>
+</div>
+"""
+
+WELCOME_HTML = """
+<div style='text-align: center; padding: 3rem 0; color: #566573;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            border-radius: 15px; margin: 2rem 0;
+            box-shadow: 0 4px 15px rgba(0,0,0,0.1);'>
+    <div style='color: white; padding: 2rem;'>
+        <h2 style='color: white; margin-bottom: 1rem;'>👋 Bem-vindo ao GitApp!</h2>
+        <p style='font-size: 1.1rem; margin-bottom: 1rem; opacity: 0.9;'>
+            Selecione um comando na lista acima para ver detalhes e exemplos de uso.
+        </p>
+        <p style='font-size: 1rem; opacity: 0.8;'>
+            💡 Use os filtros na barra lateral p/ encontrar comandos.
+        </p>
+    </div>
+</div>
+"""
+
+FOOTER_HTML_TEMPLATE = """
+<div style='text-align: center; color: #566573; padding: 2rem 0; 
+            background: white;
+            border-radius: 10px; margin-top: 2rem; 
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);'>
+    <div style='padding: 1rem;'>
+        <strong>
+            🔧GitApp: o seu web app de comandos Git
+        </strong>
+        <p style='font-size: 1rem; margin-bottom: 0.5rem; color: #34495e;'>
+            Desenvolvido por <strong>Ary Ribeiro</strong> - <a href="mailto:aryribeiro@gmail.com">aryribeiro@gmail.com</a></p>
+        <p style='font-size: 0.9rem; color: #7f8c8d; margin-bottom: 1rem;'>
+            <em>Dica: Use os filtros na barra lateral p/ encontrar comandos</em>
+        </p>
+        <div style='border-top: 1px solid #bdc3c7; padding-top: 1rem; margin-top: 1rem;'>
+            <p style='font-size: 0.8rem; color: #95a5a6; margin: 0;'>
+                📚 {total} comandos Git disponíveis | 
+                🚀 Interface moderna e intuitiva | 
+                🎯 Filtros avançados de pesquisa
+            </p>
+        </div>
+    </div>
+</div>
+"""
+
+PAGE_SIZE = 25
+
+IMPORTANCE_RANGES = {
+    "🔥 Essenciais (1-10)": (1, 10),
+    "🚀 Intermediários (11-30)": (11, 30),
+    "⚡ Avançados (31-60)": (31, 60),
+    "🔧 Técnicos (61-100)": (61, 100),
+    "🛠️ Específicos (101-157)": (101, 157),
+    "📋 Todos os comandos": (1, 157)
+}
+MAX_IMPORTANCE = max(hi for _, hi in IMPORTANCE_RANGES.values())
+
+
+def _build_importance_colors(max_importance: int) -> list:
+    """Color per importance level, indexed by importance - 1"""
+    levels = np.arange(1, max_importance + 1)
+    return np.select(
+        [levels <= 10, levels <= 30, levels <= 60, levels <= 100],
+        [
+            "#E74C3C",  # Red - Essential
+            "#F39C12",  # Orange - Intermediate
+            "#3498DB",  # Blue - Advanced
+            "#27AE60",  # Green - Technical
+        ],
+        default="#8E44AD"  # Purple - Specific
+    ).tolist()
+
+
+IMPORTANCE_COLORS = _build_importance_colors(MAX_IMPORTANCE)
+
+REQUIRED_COLUMNS = ['comando', 'descrição', 'ordem_importância', 'como_pode_ser_usado']
+
+
+@st.cache_data(ttl=None)
+def _load_commands(path: str, mtime: float) -> pd.DataFrame:
+    """Read, validate and sort the commands CSV (cached per path and mtime)"""
+    csv_path = Path(path)
+    parquet_path = csv_path.with_suffix('.parquet')
+    
+    # Keep a columnar copy of the CSV next to it for faster cold starts.
+    # The copy carries the CSV's mtime, so any change to the CSV (even to an
+    # older mtime, e.g. cp -p) triggers a rebuild.
+    try:
+        csv_mtime_ns = csv_path.stat().st_mtime_ns
+        if not parquet_path.exists() or parquet_path.stat().st_mtime_ns != csv_mtime_ns:
+            tmp_path = parquet_path.with_name(f"{parquet_path.name}.{os.getpid()}.tmp")
+            try:
+                pd.read_csv(csv_path).to_parquet(tmp_path, index=False)
+                os.utime(tmp_path, ns=(csv_mtime_ns, csv_mtime_ns))
+                # Atomic swap so readers never see a half-written file
+                os.replace(tmp_path, parquet_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+        df = pd.read_parquet(parquet_path, dtype_backend='pyarrow')
+    except (OSError, ValueError):
+        # Read-only directory or unreadable Parquet copy: fall back to the CSV
+        df = pd.read_csv(csv_path, dtype_backend='pyarrow')
+    
+    if not all(col in df.columns for col in REQUIRED_COLUMNS):
+        raise ValueError("Estrutura do CSV inválida. Colunas necessárias não encontradas.")
+    
+    # Lowercase search text, computed once instead of on every rerun.
+    # The unit separator keeps a term from matching across both fields.
+    df['_search'] = (
+        df['comando'].fillna('').str.lower() + '\x1f' + df['descrição'].fillna('').str.lower()
+    )
+    
+    # Usage examples split once so rendering is a plain iteration
+    df['_uses'] = df['como_pode_ser_usado'].fillna('').map(
+        lambda text: [example.strip() for example in text.split(', ') if example.strip()]
+    )
+    
+    # Sort by importance
+    df = df.sort_values('ordem_importância').reset_index(drop=True)
+    
+    # Distribution by importance never changes per file, so count it once here
+    imp = df['ordem_importância']
+    df.attrs['stats'] = {
+        'total': len(df),
+        'essential': int((imp <= 10).sum()),
+        'intermediate': int(((imp > 10) & (imp <= 30)).sum()),
+        'advanced': int((imp > 30).sum())
+    }
+    
+    return df
+
+
+@st.cache_data(max_entries=256)
+def _filter(path: str, mtime: float, lo: int, hi: int, term: str) -> pd.DataFrame:
+    """Filter commands by importance range and search term (memoized per filter state)"""
+    df = _load_commands(path, mtime)
+    imp = df['ordem_importância'].to_numpy()
+    
+    # df is sorted by importance, so the range is a contiguous slice
+    start = np.searchsorted(imp, lo, 'left')
+    stop = np.searchsorted(imp, hi, 'right')
+    filtered_df = df.iloc[start:stop]
+    
+    if term:
+        blob = filtered_df['_search'].to_numpy(dtype=str)
+        filtered_df = filtered_df[np.char.find(blob, term) >= 0]
+    
+    return filtered_df
 
 
 class GitCommandsApp:
     """Professional Git Commands Reference Application"""
     
     def __init__(self):
-        self.setup_page_config()
         self.load_data()
     
     def setup_page_config(self) -> None:
@@ -24,6 +216,9 @@ class GitCommandsApp:
             layout="centered",
             initial_sidebar_state="expanded"
         )
+        
+        # CSS is re-emitted on every run, otherwise Streamlit drops it on rerun
+        st.markdown(APP_CSS, unsafe_allow_html=True)
     
     def load_data(self) -> None:
         """Load Git commands data from CSV file"""
@@ -33,36 +228,17 @@ class GitCommandsApp:
                 st.error("❌ Arquivo 'comandos.csv' não encontrado no diretório atual.")
                 st.stop()
             
-            self.df = pd.read_csv(csv_path)
-            self.validate_data()
+            self._csv_path = str(csv_path)
+            self._mtime = csv_path.stat().st_mtime
+            self.df = _load_commands(self._csv_path, self._mtime)
             
         except Exception as e:
             st.error(f"❌ Erro ao carregar dados: {str(e)}")
             st.stop()
     
-    def validate_data(self) -> None:
-        """Validate CSV data structure"""
-        required_columns = ['comando', 'descrição', 'ordem_importância', 'como_pode_ser_usado']
-        
-        if not all(col in self.df.columns for col in required_columns):
-            st.error("❌ Estrutura do CSV inválida. Colunas necessárias não encontradas.")
-            st.stop()
-        
-        # Sort by importance
-        self.df = self.df.sort_values('ordem_importância').reset_index(drop=True)
-    
     def render_header(self) -> None:
         """Render application header"""
-        st.markdown("""
-        <div style='text-align: center; padding: 1rem 0;'>
-            <h1 style='color: #2E86C1; margin-bottom: 0.5rem;'>
-                🔧GitApp
-            </h1>
-            <p style='color: #566573; font-size: 1.1rem; margin-bottom: 2rem;'>
-                <strong>Web App de Comandos Git</strong>
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(HEADER_HTML, unsafe_allow_html=True)
     
     def render_sidebar_filters(self) -> dict:
         """Render sidebar filters and return filter values"""
@@ -71,28 +247,21 @@ class GitCommandsApp:
         """)
         
         # Importance level filter
-        importance_ranges = {
-            "🔥 Essenciais (1-10)": (1, 10),
-            "🚀 Intermediários (11-30)": (11, 30),
-            "⚡ Avançados (31-60)": (31, 60),
-            "🔧 Técnicos (61-100)": (61, 100),
-            "🛠️ Específicos (101-157)": (101, 157),
-            "📋 Todos os comandos": (1, 157)
-        }
-        
         selected_range = st.sidebar.selectbox(
             "Nível de Importância:",
-            list(importance_ranges.keys()),
+            list(IMPORTANCE_RANGES.keys()),
             index=0
         )
         
-        min_imp, max_imp = importance_ranges[selected_range]
+        min_imp, max_imp = IMPORTANCE_RANGES[selected_range]
         
-        # Search filter
-        search_term = st.sidebar.text_input(
-            "🔍 Buscar comando:",
-            placeholder="Ex: commit, branch, merge..."
-        ).lower().strip()
+        # Search filter (inside a form so typing only reruns on submit)
+        with st.sidebar.form("search_form", clear_on_submit=False):
+            search_term = st.text_input(
+                "🔍 Buscar comando:",
+                placeholder="Ex: commit, branch, merge..."
+            ).lower().strip()
+            st.form_submit_button("Buscar")
         
         return {
             'min_importance': min_imp,
@@ -102,21 +271,15 @@ class GitCommandsApp:
     
     def filter_commands(self, filters: dict) -> pd.DataFrame:
         """Filter commands based on user selection"""
-        filtered_df = self.df[
-            (self.df['ordem_importância'] >= filters['min_importance']) &
-            (self.df['ordem_importância'] <= filters['max_importance'])
-        ].copy()
-        
-        if filters['search_term']:
-            mask = (
-                filtered_df['comando'].str.lower().str.contains(filters['search_term'], na=False) |
-                filtered_df['descrição'].str.lower().str.contains(filters['search_term'], na=False)
-            )
-            filtered_df = filtered_df[mask]
-        
-        return filtered_df
+        return _filter(
+            self._csv_path,
+            self._mtime,
+            filters['min_importance'],
+            filters['max_importance'],
+            filters['search_term']
+        )
     
-    def render_command_selector(self, filtered_df: pd.DataFrame) -> dict:
+    def render_command_selector(self, filtered_df: pd.DataFrame) -> int:
         """Render command selection interface"""
         if filtered_df.empty:
             st.warning("🔍 Nenhum comando encontrado com os filtros aplicados.")
@@ -124,11 +287,22 @@ class GitCommandsApp:
             
         st.markdown("### 📝 Selecione um Comando")
         
+        # Paginate so the selectbox only ships one page of options to the browser
+        total_pages = math.ceil(len(filtered_df) / PAGE_SIZE)
+        if total_pages > 1:
+            page = st.number_input("Página:", min_value=1, max_value=total_pages, value=1, step=1)
+            start = (int(page) - 1) * PAGE_SIZE
+            filtered_df = filtered_df.iloc[start:start + PAGE_SIZE]
+        
         # Create display options for selectbox
-        command_options = []
-        for _, row in filtered_df.iterrows():
-            display_text = f"#{row['ordem_importância']:03d} - {row['comando']} - {row['descrição'][:50]}..."
-            command_options.append(display_text)
+        command_options = [
+            f"#{imp:03d} - {cmd} - {desc[:50]}..."
+            for imp, cmd, desc in zip(
+                filtered_df['ordem_importância'].to_numpy(),
+                filtered_df['comando'].to_numpy(),
+                filtered_df['descrição'].to_numpy()
+            )
+        ]
         
         selected_index = st.selectbox(
             "Escolha o comando Git:",
@@ -138,30 +312,33 @@ class GitCommandsApp:
         )
         
         if selected_index is not None:
-            return filtered_df.iloc[selected_index].to_dict()
+            return filtered_df.index[selected_index]
         
         return None
     
-    def render_command_details(self, selected_command: dict) -> None:
+    def render_command_details(self, idx: int) -> None:
         """Render detailed view of selected command"""
-        if not selected_command:
+        if idx is None:
             return
+        
+        command = self.df.at[idx, 'comando']
+        importance = self.df.at[idx, 'ordem_importância']
             
         # Command header
         col1, col2 = st.columns([3, 1])
         
         with col1:
             st.markdown(f"""
-            ### 🎯 `{selected_command['comando']}`
+            ### 🎯 `{command}`
             """)
         
         with col2:
-            importance_color = self.get_importance_color(selected_command['ordem_importância'])
+            importance_color = self.get_importance_color(importance)
             st.markdown(f"""
             <div style='text-align: right; padding-top: 1rem;'>
                 <span style='background-color: {importance_color}; color: white; 
                            padding: 0.3rem 0.8rem; border-radius: 15px; font-size: 0.9rem;'>
-                    Importância: #{selected_command['ordem_importância']}
+                    Importância: #{importance}
                 </span>
             </div>
             """, unsafe_allow_html=True)
@@ -169,88 +346,60 @@ class GitCommandsApp:
         # Description
         st.markdown(f"""
         **📄 Descrição:**  
-        {selected_command['descrição']}
+        {self.df.at[idx, 'descrição']}
         """)
         
         # Usage examples
         st.markdown("**💡 Como usar:**")
-        usage_examples = selected_command['como_pode_ser_usado'].split(', ')
-        
-        for i, example in enumerate(usage_examples, 1):
-            example = example.strip()
-            if example:
-                st.code(example, language='bash')
+        for example in self.df.at[idx, '_uses']:
+            st.code(example, language='bash')
         
 
     
 
     def get_importance_color(self, importance: int) -> str:
         """Get color based on command importance"""
-        if importance <= 10:
-            return "#E74C3C"  # Red - Essential
-        elif importance <= 30:
-            return "#F39C12"  # Orange - Intermediate
-        elif importance <= 60:
-            return "#3498DB"  # Blue - Advanced
-        elif importance <= 100:
-            return "#27AE60"  # Green - Technical
-        else:
-            return "#8E44AD"  # Purple - Specific
+        # Out-of-range values clamp to the first (red) or last (purple) entry
+        index = min(max(int(importance), 1), len(IMPORTANCE_COLORS)) - 1
+        return IMPORTANCE_COLORS[index]
 
-    def render_statistics(self, filtered_df: pd.DataFrame) -> None:
+    def render_statistics(self, filtered_count: int) -> None:
         """Render statistics sidebar"""
         st.sidebar.markdown("---")
         st.sidebar.markdown("### 📊 Estatísticas")
         
-        total_commands = len(self.df)
-        filtered_commands = len(filtered_df)
-        
-        st.sidebar.metric("Total de Comandos", total_commands)
-        st.sidebar.metric("Comandos Filtrados", filtered_commands)
-        
-        # Distribution by importance
-        essential = len(self.df[self.df['ordem_importância'] <= 10])
-        intermediate = len(self.df[(self.df['ordem_importância'] > 10) & (self.df['ordem_importância'] <= 30)])
-        advanced = len(self.df[self.df['ordem_importância'] > 30])
+        stats = self.df.attrs['stats']
+        st.sidebar.metric("Total de Comandos", stats['total'])
+        st.sidebar.metric("Comandos Filtrados", filtered_count)
         
+        # Distribution by importance (precomputed at load time)
         st.sidebar.markdown(f"""
         **Distribuição:**
-        - 🔥 Essenciais: {essential}
-        - 🚀 Intermediários: {intermediate}
-        - ⚡ Avançados: {advanced}
+        - 🔥 Essenciais: {stats['essential']}
+        - 🚀 Intermediários: {stats['intermediate']}
+        - ⚡ Avançados: {stats['advanced']}
         """)
     
     def render_footer(self) -> None:
         """Render application footer"""
+        st.markdown(FOOTER_HTML_TEMPLATE.format(total=self.df.attrs['stats']['total']), unsafe_allow_html=True)
+    
+    @st.fragment
+    def render_command_panel(self, filtered_df: pd.DataFrame) -> None:
+        """Render command selector and details as an isolated fragment"""
+        selected_idx = self.render_command_selector(filtered_df)
         
-        total_commands = len(self.df)
-        st.markdown(f"""
-        <div style='text-align: center; color: #566573; padding: 2rem 0; 
-                    background: white;
-                    border-radius: 10px; margin-top: 2rem; 
-                    box-shadow: 0 2px 10px rgba(0,0,0,0.1);'>
-            <div style='padding: 1rem;'>
-                <strong>
-                    🔧GitApp: o seu web app de comandos Git
-                </strong>
-                <p style='font-size: 1rem; margin-bottom: 0.5rem; color: #34495e;'>
-                    Desenvolvido por <strong>Ary Ribeiro</strong> - <a href="mailto:aryribeiro@gmail.com">aryribeiro@gmail.com</a></p>
-                <p style='font-size: 0.9rem; color: #7f8c8d; margin-bottom: 1rem;'>
-                    <em>Dica: Use os filtros na barra lateral p/ encontrar comandos</em>
-                </p>
-                <div style='border-top: 1px solid #bdc3c7; padding-top: 1rem; margin-top: 1rem;'>
-                    <p style='font-size: 0.8rem; color: #95a5a6; margin: 0;'>
-                        📚 {total_commands} comandos Git disponíveis | 
-                        🚀 Interface moderna e intuitiva | 
-                        🎯 Filtros avançados de pesquisa
-                    </p>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        if selected_idx is not None:
+            self.render_command_details(selected_idx)
+        else:
+            # Show welcome message when no command is selected
+            st.markdown(WELCOME_HTML, unsafe_allow_html=True)
     
     def run(self) -> None:
         """Main application execution"""
+        # Page config must be emitted on every rerun, unlike the cached instance
+        self.setup_page_config()
+        
         # Render header
         self.render_header()
         
@@ -261,41 +410,28 @@ class GitCommandsApp:
         filtered_df = self.filter_commands(filters)
         
         # Render statistics
-        self.render_statistics(filtered_df)
-        
-        # Main content
-        selected_command = self.render_command_selector(filtered_df)
+        self.render_statistics(len(filtered_df))
         
-        if selected_command:
-            self.render_command_details(selected_command)
-        else:
-            # Show welcome message when no command is selected
-            st.markdown("""
-            <div style='text-align: center; padding: 3rem 0; color: #566573;
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        border-radius: 15px; margin: 2rem 0;
-                        box-shadow: 0 4px 15px rgba(0,0,0,0.1);'>
-                <div style='color: white; padding: 2rem;'>
-                    <h2 style='color: white; margin-bottom: 1rem;'>👋 Bem-vindo ao GitApp!</h2>
-                    <p style='font-size: 1.1rem; margin-bottom: 1rem; opacity: 0.9;'>
-                        Selecione um comando na lista acima para ver detalhes e exemplos de uso.
-                    </p>
-                    <p style='font-size: 1rem; opacity: 0.8;'>
-                        💡 Use os filtros na barra lateral p/ encontrar comandos.
-                    </p>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        # Selector and details rerun on their own when a command is picked
+        self.render_command_panel(filtered_df)
         
         # Render footer
         self.render_footer()
 
 
+@st.cache_resource(max_entries=1)
+def get_app(csv_mtime: float) -> GitCommandsApp:
+    """Build the app once per CSV version and share it across reruns and sessions (read-only)"""
+    return GitCommandsApp()
+
+
 def main():
     """Application entry point"""
     try:
-        app = GitCommandsApp()
-        app.run()
+        # Keying on the CSV mtime rebuilds the app when comandos.csv changes
+        csv_path = Path("comandos.csv")
+        csv_mtime = csv_path.stat().st_mtime if csv_path.exists() else 0.0
+        get_app(csv_mtime).run()
     except Exception as e:
         st.error(f"❌ Erro na aplicação: {str(e)}")
         st.info("🔄 Tente recarregar a página ou verifique os arquivos necessários.")
@@ -303,35 +439,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
-st.markdown("""
-<style>
-    .main {
-        background-color: #ffffff;
-        color: #333333;
-    }
-    .block-container {
-        padding-top: 1rem;
-        padding-bottom: 0rem;
-    }
-    /* Esconde completamente todos os elementos da barra padrão do Streamlit */
-    header {display: none !important;}
-    footer {display: none !important;}
-    #MainMenu {display: none !important;}
-    /* Remove qualquer espaço em branco adicional */
-    div[data-testid="stAppViewBlockContainer"] {
-        padding-top: 0 !important;
-        padding-bottom: 0 !important;
-    }
-    div[data-testid="stVerticalBlock"] {
-        gap: 0 !important;
-        padding-top: 0 !important;
-        padding-bottom: 0 !important;
-    }
-    /* Remove quaisquer margens extras */
-    .element-container {
-        margin-top: 0 !important;
-        margin-bottom: 0 !important;
-    }
-</style>
-""", unsafe_allow_html=True)
\ No newline at end of file